@@ -56,6 +56,7 @@ from source_parser.parsers.language_parser import (
     traverse_type,
     children_of_type,
     previous_sibling,
+    encode_file_contents,
 )
 from source_parser.parsers.commentutils import strip_c_style_comment_delimiters
 
@@ -78,7 +79,7 @@ class CppParser(LanguageParser):
 
     def update(self, file_contents):
         """Update the file being parsed"""
-        self.file_bytes = file_contents.encode("utf-8")
+        self.file_bytes = encode_file_contents(file_contents)
         self.tree = self.parser.parse(self.file_bytes)
 
         # key is tuple(start_byte, end_byte)
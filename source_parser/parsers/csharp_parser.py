@@ -70,6 +70,7 @@ from source_parser.parsers.language_parser import (
     has_correct_syntax,
     traverse_type,
     children_of_type,
+    encode_file_contents,
 )
 from source_parser.parsers.commentutils import strip_c_style_comment_delimiters
 
@@ -97,7 +98,7 @@ class CSharpParser(LanguageParser):
 
     def update(self, file_contents):
         """Update the file being parsed"""
-        self.file_bytes = file_contents.encode("utf-8")
+        self.file_bytes = encode_file_contents(file_contents)
         self.tree = self.parser.parse(self.file_bytes)
         # key is tuple(start_byte, end_byte)
         self._node2namespace = {}
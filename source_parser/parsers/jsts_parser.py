@@ -42,6 +42,7 @@ from source_parser.parsers.language_parser import (
     LanguageParser,
     has_correct_syntax,
     children_of_type,
+    encode_file_contents,
 )
 from source_parser.parsers.commentutils import strip_c_style_comment_delimiters
 from source_parser.langtools.javascript import is_minified
@@ -129,7 +130,7 @@ class JSTSParser(LanguageParser):
 
     def update(self, file_contents):
         """Update the file being parsed"""
-        self.file_bytes = file_contents.encode("utf-8")
+        self.file_bytes = encode_file_contents(file_contents)
         self.tree = self.parser.parse(self.file_bytes)
         # For methods defined as variable declarations
         # the method docstring is the sibling node of the declaration
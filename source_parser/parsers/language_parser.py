@@ -104,6 +104,16 @@ def has_correct_syntax(node):
     return True
 
 
+def encode_file_contents(file_contents: Union[str, bytes]) -> bytes:
+    """
+    UTF-8 encode file contents for tree-sitter, passing
+    already encoded bytes through without a decode/encode round-trip
+    """
+    if isinstance(file_contents, bytes):
+        return file_contents
+    return file_contents.encode("utf-8")
+
+
 def children_of_type(node, types: Union[str, Tuple]):
     """
     Return children of node of type belonging to types
@@ -282,8 +292,8 @@ class LanguageParser(ABC):
 
         Parameters
         ----------
-        file_contents : str
-            string containing a source code file contents
+        file_contents : str/bytes
+            string or UTF-8 encoded bytes containing a source code file contents
         parser : tree_sitter.parser (optional)
             optional pre-initialized parser
         remove_comments: True/False
@@ -304,7 +314,7 @@ class LanguageParser(ABC):
 
     def update(self, file_contents):
         """Update the file being parsed"""
-        self.file_bytes = file_contents.encode("utf-8")
+        self.file_bytes = encode_file_contents(file_contents)
         while self.file_bytes[:1] == "\n".encode("utf-8"):
             self.starting_point += 1
             self.file_bytes = self.file_bytes[1:]
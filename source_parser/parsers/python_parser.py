@@ -40,8 +40,8 @@ class PythonParser(LanguageParser):
 
         Parameters
         ----------
-        file_contents : str
-            string containing a source code file contents
+        file_contents : str/bytes
+            string or UTF-8 encoded bytes containing a source code file contents
         parser : tree_sitter.parser (optional)
             optional pre-initialized parser
         remove_comments: True/False
@@ -8,6 +8,7 @@ from source_parser.parsers.language_parser import (
     LanguageParser,
     children_of_type,
     traverse_type,
+    encode_file_contents,
 )
 from source_parser.utils import static_hash
 
@@ -31,8 +32,8 @@ class RubyParser(LanguageParser):
 
         Parameters
         ----------
-        file_contents : str
-            string containing a source code file contents
+        file_contents : str/bytes
+            string or UTF-8 encoded bytes containing a source code file contents
         parser : tree_sitter.parser (optional)
             optional pre-initialized parser
         remove_comments: True/False
@@ -43,7 +44,7 @@ class RubyParser(LanguageParser):
 
     def update(self, file_contents):
         """Update the file being parsed"""
-        self.file_bytes = file_contents.encode("utf-8")
+        self.file_bytes = encode_file_contents(file_contents)
         self.tree = self.parser.parse(self.file_bytes)
         # key is tuple(start_byte, end_byte)
         self._node2namespace = {}
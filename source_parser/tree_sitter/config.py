@@ -69,6 +69,9 @@ LOGGER = logging.getLogger(__name__)
 # Create a lock instance
 build_library_lock = Lock()
 
+# Loaded tree-sitter Language objects, so each grammar is only loaded once per process
+LANGUAGE_CACHE = {}
+
 
 def build_library(language: LanguageId, force_build=False):
     """
@@ -128,13 +131,15 @@ def get_language(language: Union[LanguageId, str], force_build=False) -> Languag
     """
     if isinstance(language, str):
         language = LanguageId(language)
+    if not force_build and language in LANGUAGE_CACHE:
+        return LANGUAGE_CACHE[language]
     build_library(language, force_build=force_build)
 
     reponame = f"tree-sitter-{language.value}"
     langlib = LANGDIR / f"{reponame}.so"
     name = PARSER_SYMBOL_NAMES[language]
     try:
-        return Language(str(langlib), "_".join(name.split("_")[2:]))
+        tree_sitter_language = Language(str(langlib), "_".join(name.split("_")[2:]))
     except ValueError as v_err:
         LOGGER.warning(v_err)
         cache_dir = Path(langlib).parent
@@ -143,4 +148,6 @@ def get_language(language: Union[LanguageId, str], force_build=False) -> Languag
         )
         rmtree(cache_dir)
         build_library(language, force_build=True)
-        return Language(str(langlib), name)
+        tree_sitter_language = Language(str(langlib), name)
+    LANGUAGE_CACHE[language] = tree_sitter_language
+    return tree_sitter_language
@@ -2,54 +2,120 @@
 # Licensed under the MIT License.
 
 # pylint: disable=line-too-long,too-many-statements
+from functools import lru_cache
+from itertools import zip_longest
+from pathlib import Path
+
 import pytest
 from source_parser.parsers import CSharpParser
 
 DIR = "test/assets/csharp_examples/"
+GOLDEN_DIR = Path(DIR) / "golden"
+
+ATTRIBUTE_CLASS_CS = DIR + "AttributeClass.cs"
+ATTRIBUTE_METHOD_CS = DIR + "AttributeMethod.cs"
+CLASS_CS = DIR + "Class.cs"
+INTERFACE_CS = DIR + "Interface.cs"
+NESTED_CLASS_CS = DIR + "NestedClass.cs"
+NESTED_NAMESPACE_CS = DIR + "NestedNamespace.cs"
+REGION_CASE_CS = DIR + "RegionCase.cs"
+STRUCT_CS = DIR + "Struct.cs"
+
+SOURCES = {
+    path.name: path.read_bytes() for path in Path(DIR).glob("*.cs")
+}
 
 
+@lru_cache(maxsize=None)
 def create_csharp_parser(source):
-    with open(source, 'r', encoding='utf-8') as file:
-        cp = CSharpParser(file.read())
-    return cp
+    return CSharpParser(SOURCES[Path(source).name])
+
+
+@lru_cache(maxsize=None)
+def csharp_schema(source):
+    return create_csharp_parser(source).schema
+
+
+@pytest.fixture(name="class_cs", scope="module")
+def fixture_class_cs():
+    return csharp_schema(CLASS_CS)
+
+
+@pytest.fixture(name="icon_frame", scope="module")
+def fixture_icon_frame(class_cs):
+    classes = class_cs['classes']
+    assert len(classes) == 1
+    return classes[0]
+
+
+@pytest.fixture(name="struct_cs", scope="module")
+def fixture_struct_cs():
+    return csharp_schema(STRUCT_CS)
+
+
+@pytest.fixture(name="interface_cs", scope="module")
+def fixture_interface_cs():
+    return csharp_schema(INTERFACE_CS)
+
+
+@lru_cache(maxsize=None)
+def read_golden(name):
+    """Expected output too long to keep inline, stored under `GOLDEN_DIR`"""
+    return (GOLDEN_DIR / name).read_text(encoding="utf-8")
+
+
+def assert_text_eq(actual, expected):
+    """Compare long multi-line text, reporting only the first differing line on failure"""
+    if actual == expected:
+        return
+    lines = zip_longest(actual.splitlines(keepends=True), expected.splitlines(keepends=True))
+    for i, (act, exp) in enumerate(lines):
+        if act != exp:
+            raise AssertionError(f"line {i}: {act!r} != {exp!r}")
+
+
+def body_of(original_string):
+    """Expected `body`: `original_string` from its first `{`, indented to that brace's column"""
+    start = original_string.index("{")
+    column = start - original_string.rfind("\n", 0, start) - 1
+    return " " * column + original_string[start:]
 
 
 @pytest.mark.parametrize(
     "source, target",
     [
         (
-            DIR + "AttributeMethod.cs",
+            ATTRIBUTE_METHOD_CS,
             """Copyright 2011 The Noda Time Authors. All rights reserved.
  Use of this source code is governed by the Apache License 2.0,
  as found in the LICENSE.txt file.""",
         ),
         (
-            DIR + "Class.cs",
+            CLASS_CS,
             """Copyright Syncfusion Inc. 2001 - 2020. All rights reserved.""",
         ),
         (
-            DIR + "RegionCase.cs",
+            REGION_CASE_CS,
             "",
         ),
     ],
 )
 def test_file_docstring(source, target):
-    cp = create_csharp_parser(source)
-    assert cp.schema["file_docstring"] == target
+    assert csharp_schema(source)["file_docstring"] == target
 
 
 @pytest.mark.parametrize(
     "source, target",
     [
         (
-            DIR + "AttributeClass.cs",
+            ATTRIBUTE_CLASS_CS,
             [
                 "using System;",
                 "using DNTFrameworkCore.Authorization;",
             ],
         ),
         (
-            DIR + "Class.cs",
+            CLASS_CS,
             [
                 "using System;",
                 "using System.Globalization;",
@@ -63,169 +129,34 @@ def test_file_docstring(source, target):
     ],
 )
 def test_context(source, target):
-    cp = create_csharp_parser(source)
-    assert cp.schema["contexts"] == target
-
-
-def test_classes():
-    source = DIR + "Class.cs"
-    cp = create_csharp_parser(source)
-
-    classes = cp.schema['classes']
-    assert len(classes) == 1
-
-    cl = classes[0]
-
-    assert cl["original_string"] == """        [Handler(typeof(IHandler))]
-        public class IconFrame : IControlObjectSource, IHandlerSource
-        {
-                // field _a
-                private virtual readonly string _a;
-                public Size _s;
-                object IHandlerSource.Handler
-                {
-                        get { return Handler; }
-                }
-                IHandler Handler { get; set; }
-
-                /// <summary>
-                /// Gets the pixel size of the frame's bitmap
-                /// </summary>
-                /// <value>The size in pixels of the frame.</value>
-                public Size PixelSize { get { return Handler.GetPixelSize(this); } }
+    assert csharp_schema(source)["contexts"] == target
 
-                public Size Size
-                {
-                        get { return Size.Ceiling((SizeF)PixelSize / Scale); }
-                }
-                // constructor
-                IconFrame(float scale)
-                {
-                        Handler = Platform.Instance.CreateShared<IHandler>();
-                        Scale = scale;
-                }
-                /// <summary>
-                /// Initializes a new instance of the <see cref="Eto.Drawing.IconFrame"/> class.
-                /// </summary>
-                /// <param name="scale">Scale of logical to physical pixels.</param>
-                /// <param name="bitmap">Bitmap for the frame</param>
-                public IconFrame(float scale, Bitmap bitmap)
-                        : this(scale)
-                {
-                        ControlObject = Handler.Create(this, bitmap);
-                }
-                /**
-                 * This is used by platform implementations to create instances of this class with the appropriate control object.
-                 * This is not intended to be called directly.
-                 */
-                public static IconFrame FromControlObject(float scale, object controlObject)
-                {
-                        return new IconFrame(scale) { ControlObject = controlObject };
-                }
-
-                /// <summary>
-                /// Handler interface for platform implementations of the <see cref="IconFrame"/>
-                /// </summary>
-                [AutoInitialize(false)]
-                public class IHandler
-                {
-                        /// <summary>
-                        /// Gets the pixel size of the frame's bitmap
-                        /// </summary>
-                        /// <param name="frame">Frame instance to get the pixel size for</param>
-                        /// <value>The size in pixels of the frame.</value>
-                        Size GetPixelSize() {}
-                }
-        }"""
-
-    assert cl["class_docstring"] == """<summary>
- Represents a frame in an <see cref="Icon"/>.
- </summary>
- <remarks>
- The IconFrame represents a single frame in an Icon.
- Each IconFrame can have a specific pixel size and scale, which will automatically be chosen based on the display and
- draw size of the image in various Eto controls.
 
- You can load an icon from an .ico, where all frames will have a 1.0 scale (pixel size equals logical size)
- </remarks>"""
-
-    assert cl["name"] == "IconFrame"
-
-    assert cl["body"] == """        {
-                // field _a
-                private virtual readonly string _a;
-                public Size _s;
-                object IHandlerSource.Handler
-                {
-                        get { return Handler; }
-                }
-                IHandler Handler { get; set; }
-
-                /// <summary>
-                /// Gets the pixel size of the frame's bitmap
-                /// </summary>
-                /// <value>The size in pixels of the frame.</value>
-                public Size PixelSize { get { return Handler.GetPixelSize(this); } }
-
-                public Size Size
-                {
-                        get { return Size.Ceiling((SizeF)PixelSize / Scale); }
-                }
-                // constructor
-                IconFrame(float scale)
-                {
-                        Handler = Platform.Instance.CreateShared<IHandler>();
-                        Scale = scale;
-                }
-                /// <summary>
-                /// Initializes a new instance of the <see cref="Eto.Drawing.IconFrame"/> class.
-                /// </summary>
-                /// <param name="scale">Scale of logical to physical pixels.</param>
-                /// <param name="bitmap">Bitmap for the frame</param>
-                public IconFrame(float scale, Bitmap bitmap)
-                        : this(scale)
-                {
-                        ControlObject = Handler.Create(this, bitmap);
-                }
-                /**
-                 * This is used by platform implementations to create instances of this class with the appropriate control object.
-                 * This is not intended to be called directly.
-                 */
-                public static IconFrame FromControlObject(float scale, object controlObject)
-                {
-                        return new IconFrame(scale) { ControlObject = controlObject };
-                }
-
-                /// <summary>
-                /// Handler interface for platform implementations of the <see cref="IconFrame"/>
-                /// </summary>
-                [AutoInitialize(false)]
-                public class IHandler
-                {
-                        /// <summary>
-                        /// Gets the pixel size of the frame's bitmap
-                        /// </summary>
-                        /// <param name="frame">Frame instance to get the pixel size for</param>
-                        /// <value>The size in pixels of the frame.</value>
-                        Size GetPixelSize() {}
-                }
-        }"""
-
-    assert cl["module_type"] == "class"
-    assert cl["attributes"]["namespace_prefix"] == "Eto.Drawing."
-    assert cl["attributes"]["bases"] == [
+def test_classes(icon_frame):
+    assert icon_frame["name"] == "IconFrame"
+    assert icon_frame["module_type"] == "class"
+    assert icon_frame["attributes"]["namespace_prefix"] == "Eto.Drawing."
+    assert icon_frame["attributes"]["bases"] == [
         "IControlObjectSource", "IHandlerSource"]
-    assert cl["attributes"]["modifiers"] == ["public"]
-    assert cl["attributes"]["attributes"] == ["Handler(typeof(IHandler))"]
-    assert cl["start_point"] == (20, 8)
-    assert cl["end_point"] == (80, 9)
+    assert icon_frame["attributes"]["modifiers"] == ["public"]
+    assert icon_frame["attributes"]["attributes"] == ["Handler(typeof(IHandler))"]
+    assert icon_frame["start_point"] == (20, 8)
+    assert icon_frame["end_point"] == (80, 9)
+    original_string = read_golden("Class.IconFrame.original_string.txt")
+    assert_text_eq(icon_frame["original_string"], original_string)
+    assert_text_eq(icon_frame["class_docstring"], read_golden("Class.IconFrame.class_docstring.txt"))
+    assert_text_eq(icon_frame["body"], body_of(original_string))
 
 
-def test_struct():
-    source = DIR + "Struct.cs"
-    cp = create_csharp_parser(source)
-    s2, s1 = cp.schema['classes']
+def test_struct(struct_cs):
+    s2, s1 = struct_cs['classes']
 
+    assert s1["name"] == "FMaterialParameterCollectionInfo"
+    assert s1["module_type"] == "struct"
+    assert s1["attributes"]["namespace_prefix"] == "UnrealEngine.ChildEngine."
+    assert s1["attributes"]["bases"] == []
+    assert s1["attributes"]["modifiers"] == ["public", "partial"]
+    assert s1["attributes"]["attributes"] == []
     assert s1["original_string"] == """                public partial struct FMaterialParameterCollectionInfo
                 {
                         /// <summary>Id that the collection had when this material was last compiled.</summary>
@@ -234,19 +165,16 @@ def test_struct():
                         public UMaterialParameterCollection ParameterCollection;
                 }"""
     assert s1["class_docstring"] == "<summary>Stores information about a parameter collection that this material references, used to know when the material needs to be recompiled.</summary>"
-    assert s1["name"] == "FMaterialParameterCollectionInfo"
-    assert s1["body"] == """                {
-                        /// <summary>Id that the collection had when this material was last compiled.</summary>
-                        public FGuid StateId;
-                        /// <summary>The collection which this material has a dependency on.</summary>
-                        public UMaterialParameterCollection ParameterCollection;
-                }"""
-    assert s1["module_type"] == "struct"
-    assert s1["attributes"]["namespace_prefix"] == "UnrealEngine.ChildEngine."
-    assert s1["attributes"]["bases"] == []
-    assert s1["attributes"]["modifiers"] == ["public", "partial"]
-    assert s1["attributes"]["attributes"] == []
+    assert s1["body"] == body_of(s1["original_string"])
 
+    assert s2["name"] == "Coords"
+    assert s2["module_type"] == "struct"
+    assert s2["attributes"]["namespace_prefix"] == ""
+    assert s2["attributes"]["bases"] == []
+    assert s2["attributes"]["modifiers"] == ["public", "readonly"]
+    assert s2["attributes"]["attributes"] == []
+    assert s2["start_point"] == (15, 0)
+    assert s2["end_point"] == (27, 1)
     assert s2["original_string"] == """public readonly struct Coords
 {
     public Coords(double x, double y)
@@ -261,43 +189,13 @@ def test_struct():
     public override string ToString() => $"({X}, {Y})";
 }"""
     assert s2["class_docstring"] == ""
-    assert s2["name"] == "Coords"
-    assert s2["body"] == """{
-    public Coords(double x, double y)
-    {
-        X = x;
-        Y = y;
-    }
+    assert s2["body"] == body_of(s2["original_string"])
 
-    public double X { get; }
-    public double Y { get; }
-
-    public override string ToString() => $"({X}, {Y})";
-}"""
-    assert s2["module_type"] == "struct"
-    assert s2["attributes"]["namespace_prefix"] == ""
-    assert s2["attributes"]["bases"] == []
-    assert s2["attributes"]["modifiers"] == ["public", "readonly"]
-    assert s2["attributes"]["attributes"] == []
-    assert s2["start_point"] == (15, 0)
-    assert s2["end_point"] == (27, 1)
 
+def test_interface(interface_cs):
+    i1, i2, _ = interface_cs['classes']
 
-def test_interface():
-    source = DIR + "Interface.cs"
-    cp = create_csharp_parser(source)
-
-    i1, i2, _ = cp.schema['classes']
-
-    assert i1["original_string"] == """    interface IEquatable<T>
-    {
-        bool Equals(T obj);
-    }"""
-    assert i1["class_docstring"] == ""
     assert i1["name"] == "IEquatable"
-    assert i1["body"] == """    {
-        bool Equals(T obj);
-    }"""
     assert i1["module_type"] == "interface"
     assert i1["attributes"]["namespace_prefix"] == "Equal."
     assert i1["attributes"]["bases"] == []
@@ -305,7 +203,21 @@ def test_interface():
     assert i1["attributes"]["attributes"] == []
     assert i1["start_point"] == (3, 4)
     assert i1["end_point"] == (6, 5)
+    assert i1["original_string"] == """    interface IEquatable<T>
+    {
+        bool Equals(T obj);
+    }"""
+    assert i1["class_docstring"] == ""
+    assert i1["body"] == body_of(i1["original_string"])
 
+    assert i2["name"] == "ISampleInterface"
+    assert i2["module_type"] == "interface"
+    assert i2["attributes"]["namespace_prefix"] == "Equal."
+    assert i2["attributes"]["bases"] == []
+    assert i2["attributes"]["modifiers"] == ["public"]
+    assert i2["attributes"]["attributes"] == []
+    assert i2["start_point"] == (8, 4)
+    assert i2["end_point"] == (16, 5)
     assert i2["original_string"] == """    public interface ISampleInterface
     {
         // Property declaration:
@@ -316,34 +228,11 @@ def test_interface():
         }
     }"""
     assert i2["class_docstring"] == ""
-    assert i2["name"] == "ISampleInterface"
-    assert i2["body"] == """    {
-        // Property declaration:
-        string Name
-        {
-            get;
-            set;
-        }
-    }"""
-    assert i2["module_type"] == "interface"
-    assert i2["attributes"]["namespace_prefix"] == "Equal."
-    assert i2["attributes"]["bases"] == []
-    assert i2["attributes"]["modifiers"] == ["public"]
-    assert i2["attributes"]["attributes"] == []
-    assert i2["start_point"] == (8, 4)
-    assert i2["end_point"] == (16, 5)
+    assert i2["body"] == body_of(i2["original_string"])
 
 
-def test_class_fields():
-    source = DIR + "Class.cs"
-    cp = create_csharp_parser(source)
-
-    classes = cp.schema['classes']
-    assert len(classes) == 1
-
-    cl = classes[0]
-
-    f1, f2 = cl["attributes"]["fields"]
+def test_class_fields(icon_frame):
+    f1, f2 = icon_frame["attributes"]["fields"]
     assert f1["original_string"] == "private virtual readonly string _a;"
     assert f1["docstring"] == "field _a"
     assert f1["modifiers"] == ["private", "virtual", "readonly"]
@@ -357,16 +246,8 @@ def test_class_fields():
     assert f2["name"] == "_s"
 
 
-def test_class_properties():
-    source = DIR + "Class.cs"
-    cp = create_csharp_parser(source)
-
-    classes = cp.schema['classes']
-    assert len(classes) == 1
-
-    cl = classes[0]
-
-    p1, p2, p3, p4 = cl["attributes"]["properties"]
+def test_class_properties(icon_frame):
+    p1, p2, p3, p4 = icon_frame["attributes"]["properties"]
     assert p1["original_string"] == """object IHandlerSource.Handler
                 {
                         get { return Handler; }
@@ -410,11 +291,8 @@ def test_class_properties():
                 }"""
 
 
-def test_struct_fields_properties():
-    source = DIR + "Struct.cs"
-    cp = create_csharp_parser(source)
-
-    s2, s1 = cp.schema['classes']
+def test_struct_fields_properties(struct_cs):
+    s2, s1 = struct_cs['classes']
 
     f1, f2 = s1["attributes"]["fields"]
     assert f1["original_string"] == "public FGuid StateId;"
@@ -438,11 +316,8 @@ def test_struct_fields_properties():
     assert p1["accessors"] == "{ get; }"
 
 
-def test_interface_fields_properties():
-    source = DIR + "Interface.cs"
-    cp = create_csharp_parser(source)
-
-    _, i2, _ = cp.schema['classes']
+def test_interface_fields_properties(interface_cs):
+    _, i2, _ = interface_cs['classes']
 
     p1 = i2["attributes"]["properties"][0]
 
@@ -461,16 +336,8 @@ def test_interface_fields_properties():
         }"""
 
 
-def test_methods():
-    source = DIR + "Class.cs"
-    cp = create_csharp_parser(source)
-
-    classes = cp.schema['classes']
-    assert len(classes) == 1
-
-    cl = classes[0]
-
-    m1, m2, m3 = cl["methods"]
+def test_methods(icon_frame, struct_cs, interface_cs):
+    m1, m2, m3 = icon_frame["methods"]
     assert m1["original_string"] == """                IconFrame(float scale)
                 {
                         Handler = Platform.Instance.CreateShared<IHandler>();
@@ -478,10 +345,7 @@ def test_methods():
                 }"""
     assert m1["docstring"] == "constructor"
     assert m1["name"] == "IconFrame"
-    assert m1["body"] == """                {
-                        Handler = Platform.Instance.CreateShared<IHandler>();
-                        Scale = scale;
-                }"""
+    assert m1["body"] == body_of(m1["original_string"])
     assert m1["signature"] == "                IconFrame(float scale)"
     assert m1["attributes"]["namespace_prefix"] == ""
     assert m1["attributes"]["modifiers"] == []
@@ -502,9 +366,7 @@ def test_methods():
  <param name="scale">Scale of logical to physical pixels.</param>
  <param name="bitmap">Bitmap for the frame</param>"""
     assert m2["name"] == "IconFrame"
-    assert m2["body"] == """                {
-                        ControlObject = Handler.Create(this, bitmap);
-                }"""
+    assert m2["body"] == body_of(m2["original_string"])
     assert m2["signature"] == "                public IconFrame(float scale, Bitmap bitmap)"
     assert m2["attributes"]["namespace_prefix"] == ""
     assert m2["attributes"]["modifiers"] == ["public"]
@@ -524,9 +386,7 @@ def test_methods():
     assert m3["docstring"] == """This is used by platform implementations to create instances of this class with the appropriate control object.
 This is not intended to be called directly."""
     assert m3["name"] == "FromControlObject"
-    assert m3["body"] == """                {
-                        return new IconFrame(scale) { ControlObject = controlObject };
-                }"""
+    assert m3["body"] == body_of(m3["original_string"])
     assert m3["signature"] == "                public static IconFrame FromControlObject(float scale, object controlObject)"
     assert m3["attributes"]["namespace_prefix"] == ""
     assert m3["attributes"]["modifiers"] == ["public", "static"]
@@ -539,10 +399,9 @@ This is not intended to be called directly."""
     assert m3["start_point"] == (62, 16)
     assert m3["end_point"] == (65, 17)
 
-    source = DIR + "AttributeMethod.cs"
-    cp = create_csharp_parser(source)
+    schema = csharp_schema(ATTRIBUTE_METHOD_CS)
 
-    classes = cp.schema['classes']
+    classes = schema['classes']
 
     cl = classes[0]
 
@@ -555,10 +414,7 @@ This is not intended to be called directly."""
         }"""
     assert m1["docstring"] == ""
     assert m1["name"] == "Value_Success"
-    assert m1["body"] == """        {
-            ParseResult<int> result = ParseResult<int>.ForValue(5);
-            Assert.AreEqual(5, result.Value);
-        }"""
+    assert m1["body"] == body_of(m1["original_string"])
     assert m1["signature"] == "        public void Value_Success()"
     assert m1["attributes"]["namespace_prefix"] == ""
     assert m1["attributes"]["modifiers"] == ["public"]
@@ -573,9 +429,7 @@ This is not intended to be called directly."""
         }"""
     assert m2["docstring"] == ""
     assert m2["name"] == "Value_Failure"
-    assert m2["body"] == """        {
-            Assert.Throws<UnparsableValueException>(() => FailureResult.Value.GetHashCode());
-        }"""
+    assert m2["body"] == body_of(m2["original_string"])
     assert m2["signature"] == "        public void Value_Failure()"
     assert m2["attributes"]["namespace_prefix"] == ""
     assert m2["attributes"]["modifiers"] == ["public"]
@@ -583,9 +437,7 @@ This is not intended to be called directly."""
     assert m2["attributes"]["parameters"] == []
     assert m2["attributes"]["return_type"] == "void"
 
-    source = DIR + "Struct.cs"
-    cp = create_csharp_parser(source)
-    s2, _ = cp.schema['classes']
+    s2, _ = struct_cs['classes']
 
     m1, m2 = s2["methods"]
     assert m1["original_string"] == """    public Coords(double x, double y)
@@ -595,10 +447,7 @@ This is not intended to be called directly."""
     }"""
     assert m1["docstring"] == ""
     assert m1["name"] == "Coords"
-    assert m1["body"] == """    {
-        X = x;
-        Y = y;
-    }"""
+    assert m1["body"] == body_of(m1["original_string"])
     assert m1["signature"] == "    public Coords(double x, double y)"
     assert m1["attributes"]["namespace_prefix"] == ""
     assert m1["attributes"]["modifiers"] == ["public"]
@@ -617,10 +466,7 @@ This is not intended to be called directly."""
     assert m2["attributes"]["parameters"] == []
     assert m2["attributes"]["return_type"] == "string"
 
-    source = DIR + "Interface.cs"
-    cp = create_csharp_parser(source)
-
-    i1, _, _ = cp.schema['classes']
+    i1, _, _ = interface_cs['classes']
 
     m1 = i1["methods"][0]
     assert m1["original_string"] == """        bool Equals(T obj);"""
@@ -636,10 +482,9 @@ This is not intended to be called directly."""
 
 
 def test_nested_class():
-    source = DIR + "NestedClass.cs"
-    cp = create_csharp_parser(source)
+    schema = csharp_schema(NESTED_CLASS_CS)
 
-    classes = cp.schema['classes']
+    classes = schema['classes']
     assert len(classes) == 1
 
     cl = classes[0]
@@ -651,10 +496,7 @@ def test_nested_class():
     }"""
     assert cl["class_docstring"] == "This is a nested class"
     assert cl["name"] == "Soldier"
-    assert cl["body"] == """                          {
-        // A method
-        Soldier(int x) {}
-    }"""
+    assert cl["body"] == body_of(cl["original_string"])
     assert cl["methods"][0]["original_string"] == "        Soldier(int x) {}"
     assert cl["methods"][0]["docstring"] == "A method"
     assert cl["start_point"] == (8, 4)
@@ -662,10 +504,9 @@ def test_nested_class():
 
 
 def test_nested_namespace():
-    source = DIR + "NestedNamespace.cs"
-    cp = create_csharp_parser(source)
+    schema = csharp_schema(NESTED_NAMESPACE_CS)
 
-    classes = cp.schema['classes']
+    classes = schema['classes']
 
     c1, c2 = classes
 
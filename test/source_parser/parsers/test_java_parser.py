@@ -2,28 +2,46 @@
 # Licensed under the MIT License.
 
 # pylint: disable=line-too-long
+from functools import lru_cache
+from pathlib import Path
+
 import pytest
 from source_parser.parsers.java_parser import JavaParser
 
 DIR = "test/assets/java_examples/"
 
+AW_BROWSER_CONTEXT_JAVA = DIR + "AwBrowserContext.java"
+CLASS_EXAMPLES_JAVA = DIR + "ClassExamples.java"
+EXAMPLE_UNIT_TEST_JAVA = DIR + "ExampleUnitTest.java"
+MINIMAL_EXAMPLE_JAVA = DIR + "MinimalExample.java"
+NESTED_CLASS_EXAMPLE_JAVA = DIR + "NestedClassExample.java"
+TRICKY_FILE_COMMENT_JAVA = DIR + "TrickyFileComment.java"
+
+SOURCES = {path.name: path.read_bytes() for path in Path(DIR).glob("*.java")}
 
+
+@lru_cache(maxsize=None)
 def create_java_parser(source):
-    with open(source, 'r', encoding='utf-8') as file:
-        jp = JavaParser(file.read())
-    return jp
+    return JavaParser(SOURCES[Path(source).name])
+
+
+@lru_cache(maxsize=None)
+def parse_java_classes(source):
+    """Parsed top-level class dicts of `source`, shared read-only between tests"""
+    jp = create_java_parser(source)
+    return tuple(jp._parse_class_node(class_node) for class_node in jp.class_nodes)
 
 
 @pytest.mark.parametrize(
     "source, target",
     [
         (
-            DIR + "AwBrowserContext.java",
+            AW_BROWSER_CONTEXT_JAVA,
             """ Copyright (c) 2013 The Chromium Authors. All rights reserved.""",
         ),
-        (DIR + "ExampleUnitTest.java", ""),
+        (EXAMPLE_UNIT_TEST_JAVA, ""),
         (
-            DIR + "TrickyFileComment.java",
+            TRICKY_FILE_COMMENT_JAVA,
             """\nThis is a file comment\n""",
         ),
     ],
@@ -35,11 +53,7 @@ def test_file_docstring(source, target):
 
 def test_classes_class_examples():
 
-    source = DIR + "/ClassExamples.java"
-    jp = create_java_parser(source)
-    class_dict_list = [
-        jp._parse_class_node(class_node) for class_node in jp.class_nodes
-    ]
+    class_dict_list = parse_java_classes(CLASS_EXAMPLES_JAVA)
 
     class_1, class_2 = class_dict_list
     assert (
@@ -202,16 +216,11 @@ This is Javadoc for ClassExample1
 
 def test_minimal_example():
 
-    source = DIR + "/MinimalExample.java"
-    jp = create_java_parser(source)
-
-    class_dict_list = [
-        jp._parse_class_node(class_node) for class_node in jp.class_nodes
-    ]
+    class_dict_list = parse_java_classes(MINIMAL_EXAMPLE_JAVA)
 
     # pprint(class_dict_list)
     # print(class_dict_list)
-    assert class_dict_list == [
+    assert list(class_dict_list) == [
         {
             "original_string": '@MyMarkerNotation\npublic class Class1 {\n\n    /*\n     * Field javadoc\n     */\n    private int a;\n\n    public Class1(int a) {\n        self.a = a;\n    }\n\n    // A function\n    public int returnA() {\n        return self.a;\n    }\n\n    @Marker\n    public static void printHi() {\n        System.out.println("Hi");\n    } \n    \n}',
             "byte_span": (172, 492),
@@ -306,12 +315,7 @@ def test_minimal_example():
 
 def test_nested_class_example():
 
-    source = DIR + "/NestedClassExample.java"
-    jp = create_java_parser(source)
-
-    class_dict_list = [
-        jp._parse_class_node(class_node) for class_node in jp.class_nodes
-    ]
+    class_dict_list = parse_java_classes(NESTED_CLASS_EXAMPLE_JAVA)
 
     assert class_dict_list[0]["attributes"]["classes"][0]["name"] == "nested"
     assert (
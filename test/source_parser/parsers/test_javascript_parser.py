@@ -2,7 +2,8 @@
 # Licensed under the MIT License.
 
 # pylint: disable=line-too-long
-from pprint import pprint
+from functools import lru_cache
+from pathlib import Path
 import pytest
 from source_parser.parsers import JavascriptParser
 from source_parser.parsers.language_parser import children_of_type
@@ -10,11 +11,24 @@ from source_parser.parsers.language_parser import children_of_type
 
 DIR = "test/assets/javascript_examples/"
 
+SOURCES = {path.name: path.read_bytes() for path in Path(DIR).glob("*.js")}
 
+
+@lru_cache(maxsize=None)
 def create_javascript_parser(source):
-    with open(source, 'r', encoding='utf-8') as file:
-        jp = JavascriptParser(file.read())
-    return jp
+    return JavascriptParser(SOURCES[Path(source).name])
+
+
+@lru_cache(maxsize=None)
+def function_declarations(source):
+    """Top-level `function_declaration` nodes of `source`, found once per file"""
+    jp = create_javascript_parser(source)
+    return tuple(children_of_type(jp.tree.root_node, "function_declaration"))
+
+
+@lru_cache(maxsize=None)
+def javascript_schema(source):
+    return create_javascript_parser(source).schema
 
 
 @pytest.mark.parametrize(
@@ -54,10 +68,6 @@ def create_javascript_parser(source):
 def test_file_docstring(source, target):
     jp = create_javascript_parser(source)
     file_docstring = jp.file_docstring
-    print("file_docstring")
-    print(file_docstring)
-    print("target")
-    print(target)
     assert file_docstring == target
 
 
@@ -80,12 +90,9 @@ def test_file_docstring(source, target):
 def test_function_docstring(source, target):
     function_docstring_list = []
     jp = create_javascript_parser(source)
-    function_nodes = children_of_type(jp.tree.root_node, "function_declaration")
+    function_nodes = function_declarations(source)
     for func in function_nodes:
         function_docstring_list.append(jp.get_docstring(jp.tree.root_node, func))
-    print(target)
-    print("now mine")
-    print(function_docstring_list)
     assert function_docstring_list == target
 
 
@@ -112,15 +119,13 @@ def test_function_docstring(source, target):
 def test_function_names(source, target):
     function_names = []
     jp = create_javascript_parser(source)
-    function_nodes = children_of_type(jp.tree.root_node, "function_declaration")
+    function_nodes = function_declarations(source)
     for func in function_nodes:
         function_names.append(
             jp.span_select(
                 JavascriptParser.get_first_child_of_type(func, type_string="identifier"), indent=False
             )
         )
-    print(function_names)
-    print(target)
     assert function_names == target
 
 
@@ -167,14 +172,11 @@ def test_function_names(source, target):
 def test_function_signature(source, target):
     function_signatures = []
     jp = create_javascript_parser(source)
-    function_nodes = children_of_type(jp.tree.root_node, "function_declaration")
+    function_nodes = function_declarations(source)
     for func in function_nodes:
         function_signatures.append(
             jp.get_signature_default_args(func)[0]
         )
-    print(function_signatures)
-    print("target")
-    print(target)
     assert function_signatures == target
 
 
@@ -226,7 +228,7 @@ def test_function_signature(source, target):
 def test_function_original_string(source, target):
     func_original = []
     jp = create_javascript_parser(source)
-    function_nodes = children_of_type(jp.tree.root_node, "function_declaration")
+    function_nodes = function_declarations(source)
     for func in function_nodes:
         func_original.append(jp.span_select(func, indent=False))
     assert func_original == target
@@ -262,19 +264,9 @@ def test_method_docstring(source, target):
     jp = create_javascript_parser(source)
     class_nodes = children_of_type(jp.tree.root_node, "class_declaration")
     for class_node in class_nodes:
-        class_method_nodes = []
-        for child in class_node.children:
-            if child.type == "class_body":
-                class_body = child
-                for grand_child in class_body.children:
-                    if grand_child.type == "method_definition":
-                        class_method_nodes.append(grand_child)
-        parent_node = JavascriptParser.get_first_child_of_type(class_node, type_string="class_body")
-        for method in class_method_nodes:
-            method_docstring.append(jp.get_docstring(parent_node, method))
-    print(method_docstring)
-    print("target")
-    print(target)
+        class_body = JavascriptParser.get_first_child_of_type(class_node, type_string="class_body")
+        for method in children_of_type(class_body, "method_definition"):
+            method_docstring.append(jp.get_docstring(class_body, method))
     assert method_docstring == target
 
 
@@ -284,14 +276,11 @@ def test_method_docstring(source, target):
 def test_func_default(source, target):
     jp = create_javascript_parser(source)
     list_of_default_dicts = []
-    function_nodes = children_of_type(jp.tree.root_node, "function_declaration")
+    function_nodes = function_declarations(source)
     for function in function_nodes:
         list_of_default_dicts.append(
             jp.get_signature_default_args(function)[1]
         )
-    print(list_of_default_dicts)
-    print("target")
-    print(target)
     assert list_of_default_dicts == target
 
 
@@ -347,9 +336,6 @@ def test_class_attributes(source, target):
             for child in children_of_type(class_node, "class_heritage")
         ]
         results_holder.append(results)
-    print(results_holder)
-    print("target")
-    print(target)
     assert results_holder == target
 
 
@@ -374,22 +360,15 @@ def test_class_attributes(source, target):
 def test_file_context(source, target):
     jp = create_javascript_parser(source)
     file_context = jp.file_context
-    print("file_context")
-    print(file_context)
-    print("target")
-    print(target)
     assert file_context == target
 
 
 def test_schema_method():
     source = DIR + "example1.js"
-    jp = create_javascript_parser(source)
-
-    m1 = jp.schema["methods"][0]
+    m1 = javascript_schema(source)["methods"][0]
 
-    assert (
-        m1["original_string"]
-        == """function bytes(value, options, mone=12) {
+    m1_expected = {
+        "original_string": """function bytes(value, options, mone=12) {
   if (typeof value === 'string') {
     return parse(value);
   }
@@ -399,11 +378,8 @@ def test_schema_method():
   }
 
   return null;
-}"""
-    )
-    assert (
-        m1["docstring"]
-        == """
+}""",
+        "docstring": """
 Convert the given value in bytes into a string or parse to string to an integer in bytes.
 
 @param {string|number} value
@@ -416,11 +392,8 @@ Convert the given value in bytes into a string or parse to string to an integer
  }} [options] bytes options.
 
 @returns {string|number|null}
-"""
-    )
-    assert (
-        m1["body"]
-        == """{
+""",
+        "body": """{
   if (typeof value === 'string') {
     return parse(value);
   }
@@ -430,63 +403,55 @@ Convert the given value in bytes into a string or parse to string to an integer
   }
 
   return null;
-}"""
-    )
-    assert m1["default_arguments"] == {'value': '', 'options': '', 'mone': '12'}
-    assert m1["attributes"] == {"keywords": "function"}
-    assert m1["name"] == "bytes"
-    assert m1["signature"] == "function bytes(value, options, mone=12)"
-    assert m1["start_point"] == (53, 0)
-    assert m1["end_point"] == (63, 1)
+}""",
+        "default_arguments": {'value': '', 'options': '', 'mone': '12'},
+        "attributes": {"keywords": "function"},
+        "name": "bytes",
+        "signature": "function bytes(value, options, mone=12)",
+        "start_point": (53, 0),
+        "end_point": (63, 1),
+    }
+    assert {key: m1[key] for key in m1_expected} == m1_expected
 
     source = DIR + "functions.js"
-    jp = create_javascript_parser(source)
-
-    m1, m2, m3, m4, m5, m6, _, _, _ = jp.schema["methods"]
+    m1, m2, m3, m4, m5, m6, _, _, _ = javascript_schema(source)["methods"]
 
-    assert (
-        m2["original_string"]
-        == """Animal.prototype.speak = function () {
+    m2_expected = {
+        "original_string": """Animal.prototype.speak = function () {
     console.log(`${this.name} makes a noise.`);
-}"""
-    )
-    assert m2["docstring"] == ""
-    assert (
-        m2["body"]
-        == """{
+}""",
+        "docstring": "",
+        "body": """{
     console.log(`${this.name} makes a noise.`);
-}"""
-    )
-    assert m2["attributes"] == {}
-    assert m2["name"] == ""
-    assert m2["signature"] == "Animal.prototype.speak = function ()"
-    assert m2["start_point"] == (4, 25)
-    assert m2["end_point"] == (6, 1)
+}""",
+        "attributes": {},
+        "name": "",
+        "signature": "Animal.prototype.speak = function ()",
+        "start_point": (4, 25),
+        "end_point": (6, 1),
+    }
+    assert {key: m2[key] for key in m2_expected} == m2_expected
 
-    assert (
-        m3["original_string"]
-        == """var animal = (
+    m3_expected = {
+        "original_string": """var animal = (
     function() {
         this.a = 0;
     }
-)"""
-    )
-    assert m3["docstring"] == " comment"
-    assert (
-        m3["body"]
-        == """{
+)""",
+        "docstring": " comment",
+        "body": """{
         this.a = 0;
-    }"""
-    )
-    assert m3["attributes"] == {}
-    assert m3["name"] == ""
-    assert m3["signature"] == "var animal = (\n    function()"
-    assert m3["start_point"] == (10, 4)
-    assert m3["end_point"] == (12, 5)
+    }""",
+        "attributes": {},
+        "name": "",
+        "signature": "var animal = (\n    function()",
+        "start_point": (10, 4),
+        "end_point": (12, 5),
+    }
+    assert {key: m3[key] for key in m3_expected} == m3_expected
 
-    assert (
-        m4["original_string"]
-        == """BobsGarage.Car = function() {
+    m4_expected = {
+        "original_string": """BobsGarage.Car = function() {
 
     /**
      * Engine
@@ -503,12 +468,9 @@ Convert the given value in bytes into a string or parse to string to an integer
     }
 
     this.engine = new Engine();
-};"""
-    )
-    assert m4["docstring"] == " comment"
-    assert (
-        m4["body"]
-        == """{
+};""",
+        "docstring": " comment",
+        "body": """{
 
     /**
      * Engine
@@ -525,11 +487,14 @@ Convert the given value in bytes into a string or parse to string to an integer
     }
 
     this.engine = new Engine();
-}"""
-    )
-    assert m4["attributes"] == {}
-    assert m4["name"] == ""
-    assert m4["signature"] == "BobsGarage.Car = function()"
+}""",
+        "attributes": {},
+        "name": "",
+        "signature": "BobsGarage.Car = function()",
+        "start_point": (17, 17),
+        "end_point": (34, 1),
+    }
+    assert {key: m4[key] for key in m4_expected} == m4_expected
     assert (
         m4["methods"][0]["original_string"]
         == """var Engine = function() {
@@ -542,34 +507,33 @@ Convert the given value in bytes into a string or parse to string to an integer
         console.log('start engine');
     }"""
     )
-    assert m4["start_point"] == (17, 17)
-    assert m4["end_point"] == (34, 1)
 
-    assert (
-        m5["original_string"]
-        == """const obj = {
+    m5_expected = {
+        "original_string": """const obj = {
     foo() {
         return 'bar';
     }
-};"""
-    )
-    assert m5["docstring"] == " comment"
-    assert m5["name"] == "foo"
-    # NOTE the signature here is incorrect. This test simply confirms the current functionality, even though the correct output would be `foo()`
-    assert m5["signature"] == "const obj = {\n    foo()"
-    assert m5["start_point"] == (38, 4)
-    assert m5["end_point"] == (40, 5)
-
-    assert (
-        m6["original_string"] == "const factorial = function fac(n=1) {return n < 2 ? 1 : n * fac(n-1)}"
-    )
-    assert m6["docstring"] == "  comment"
-    assert m6["body"] == "{return n < 2 ? 1 : n * fac(n-1)}"
-    assert m6["default_arguments"] == {"n": "1"}
-    assert m6["name"] == "factorial"  # function fac is assigned to factorial
-    assert m6["signature"] == "const factorial = function fac(n=1)"
-    assert m6["start_point"] == (44, 18)
-    assert m6["end_point"] == (44, 69)
+};""",
+        "docstring": " comment",
+        "name": "foo",
+        # NOTE the signature here is incorrect. This test simply confirms the current functionality, even though the correct output would be `foo()`
+        "signature": "const obj = {\n    foo()",
+        "start_point": (38, 4),
+        "end_point": (40, 5),
+    }
+    assert {key: m5[key] for key in m5_expected} == m5_expected
+
+    m6_expected = {
+        "original_string": "const factorial = function fac(n=1) {return n < 2 ? 1 : n * fac(n-1)}",
+        "docstring": "  comment",
+        "body": "{return n < 2 ? 1 : n * fac(n-1)}",
+        "default_arguments": {"n": "1"},
+        "name": "factorial",  # function fac is assigned to factorial
+        "signature": "const factorial = function fac(n=1)",
+        "start_point": (44, 18),
+        "end_point": (44, 69),
+    }
+    assert {key: m6[key] for key in m6_expected} == m6_expected
 
 
 @pytest.mark.parametrize(
@@ -626,33 +590,29 @@ Convert the given value in bytes into a string or parse to string to an integer
     ],
 )
 def test_schema_class(source, target):
-    jp = create_javascript_parser(source)
-    class_info = jp.schema["classes"]
-    pprint(class_info)
-    print("target")
-    pprint(target)
+    class_info = javascript_schema(source)["classes"]
     assert class_info == target
 
 
 def test_other_class():
     source = DIR + "OtherClass.js"
-    jp = create_javascript_parser(source)
-
-    c1 = jp.schema["classes"][0]
-    assert (
-        c1["original_string"]
-        == """class {
+    c1 = javascript_schema(source)["classes"][0]
+    c1_expected = {
+        "original_string": """class {
     constructor(type) {
         this.type = type;
     }
     identify() {
         console.log(this.type);
     }
-}"""
-    )
-    assert c1["class_docstring"] == " class"
-    assert c1["name"] == "Animal"
-    assert c1["attributes"] == {"decorators": [], "expression": [], "heritage": []}
+}""",
+        "class_docstring": " class",
+        "name": "Animal",
+        "attributes": {"decorators": [], "expression": [], "heritage": []},
+        "start_point": (3, 13),
+        "end_point": (10, 1),
+    }
+    assert {key: c1[key] for key in c1_expected} == c1_expected
 
     assert (
         c1["methods"][0]["original_string"]
@@ -666,5 +626,3 @@ def test_other_class():
         console.log(this.type);
     }"""
     )
-    assert c1["start_point"] == (3, 13)
-    assert c1["end_point"] == (10, 1)
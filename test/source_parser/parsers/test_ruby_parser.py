@@ -1,16 +1,29 @@
 # Copyright (c) Microsoft Corporation.
 # Licensed under the MIT License.
 
+from functools import lru_cache
+from pathlib import Path
 import pytest
 from source_parser.parsers import RubyParser
 
 DIR = "test/assets/ruby_examples/"
 
+SOURCES = {path.name: path.read_bytes() for path in Path(DIR).glob("*.rb")}
 
+
+@lru_cache(maxsize=None)
 def create_ruby_parser(source):
-    with open(source, 'r', encoding='utf-8') as file:
-        rp = RubyParser(file.read())
-    return rp
+    return RubyParser(SOURCES[Path(source).name])
+
+
+@lru_cache(maxsize=None)
+def ruby_schema(source):
+    return create_ruby_parser(source).schema
+
+
+@lru_cache(maxsize=None)
+def ruby_classes_by_name(source):
+    return {cl["name"]: cl for cl in ruby_schema(source)["classes"]}
 
 
 @pytest.mark.parametrize(
@@ -32,23 +45,19 @@ def create_ruby_parser(source):
     ],
 )
 def test_context(source, target):
-    rp = create_ruby_parser(source)
-    assert rp.schema["contexts"] == target
+    assert ruby_schema(source)["contexts"] == target
 
 
 def test_classes():
     source = DIR + "example.rb"
-    rp = create_ruby_parser(source)
-
-    classes = rp.schema['classes']
-    assert len(classes) == 4
+    assert len(ruby_schema(source)['classes']) == 4
 
-    cl1 = classes[0]
-    cl2 = classes[2]
-    cl3 = classes[3]
-    cl4 = classes[1]
+    classes = ruby_classes_by_name(source)
+    cl1 = classes["CredentialNormalization"]
+    cl2 = classes["RegistrationsVerifier"]
+    cl3 = classes["RegistrationCleaner"]
+    cl4 = classes["BackfillRepositoryVulnerabilityAlertsActiveTransition"]
 
-    assert cl1["name"] == "CredentialNormalization"
     assert cl1["definition"] == "    class CredentialNormalization < Transition"
     assert cl1["attributes"]["namespace_prefix"] == "A.B."
     assert cl1["attributes"]["bases"] == ["Transition"]
@@ -59,19 +68,16 @@ def test_classes():
         "      CLEANUP_BATCH_SIZE = 1000",
     ]
 
-    assert cl2["name"] == "RegistrationsVerifier"
     assert cl2["definition"] == "      class RegistrationsVerifier"
     assert cl2["attributes"]["namespace_prefix"] == "A.B."
     assert cl2["attributes"]["bases"] == []
     assert cl2["attributes"]["attribute_expressions"] == []
 
-    assert cl3["name"] == "RegistrationCleaner"
     assert cl3["definition"] == "      class RegistrationCleaner"
     assert cl3["attributes"]["namespace_prefix"] == "A.B."
     assert cl3["attributes"]["bases"] == []
     assert cl3["attributes"]["attribute_expressions"] == []
 
-    assert cl4["name"] == "BackfillRepositoryVulnerabilityAlertsActiveTransition"
     assert cl4["definition"] == "    class BackfillRepositoryVulnerabilityAlertsActiveTransition < ActiveRecord::Migration[7.1]"
     assert cl4["attributes"]["namespace_prefix"] == "A.B."
     assert cl4["attributes"]["bases"] == ["ActiveRecord::Migration[7.1]"]
@@ -80,14 +86,11 @@ def test_classes():
 
 def test_methods():
     source = DIR + "example.rb"
-    rp = create_ruby_parser(source)
-
-    classes = rp.schema['classes']
-
-    cl1 = classes[0]
-    cl2 = classes[2]
-    cl3 = classes[3]
-    cl4 = classes[1]
+    classes = ruby_classes_by_name(source)
+    cl1 = classes["CredentialNormalization"]
+    cl2 = classes["RegistrationsVerifier"]
+    cl3 = classes["RegistrationCleaner"]
+    cl4 = classes["BackfillRepositoryVulnerabilityAlertsActiveTransition"]
 
     m1, m2, m3, m4 = cl1["methods"]
     assert m1["name"] == "after_initialize"
@@ -136,9 +139,7 @@ def test_methods():
 
 def test_nested_class():
     source = DIR + "example.rb"
-    rp = create_ruby_parser(source)
-
-    classes = rp.schema['classes']
+    classes = ruby_schema(source)['classes']
 
     cl = classes[0]
 
@@ -155,9 +156,7 @@ def test_nested_class():
 
 def test_include():
     source = DIR + "example2.rb"
-    rp = create_ruby_parser(source)
-
-    classes = rp.schema['classes']
+    classes = ruby_schema(source)['classes']
 
     cl = classes[0]
 
@@ -166,9 +165,7 @@ def test_include():
 
 def test_open_classes():
     source = DIR + "example3.rb"
-    rp = create_ruby_parser(source)
-
-    classes = rp.schema['classes']
+    classes = ruby_schema(source)['classes']
 
     assert len(classes) == 1
 
@@ -191,9 +188,7 @@ def test_module_level_methods():
     This unit test tests module-level method
     '''
     source = DIR + "example4.rb"
-    rp = create_ruby_parser(source)
-
-    methods = rp.schema['methods']
+    methods = ruby_schema(source)['methods']
 
     assert len(methods) == 2
 
@@ -216,9 +211,7 @@ def test_class_level_methods():
     This unit test tests module-level method
     '''
     source = DIR + "example5.rb"
-    rp = create_ruby_parser(source)
-
-    classes = rp.schema['classes']
+    classes = ruby_schema(source)['classes']
 
     assert len(classes) == 1
 
@@ -241,9 +234,7 @@ def test_single_module():
     This unit test tests parsing of single module
     '''
     source = DIR + "example6.rb"
-    rp = create_ruby_parser(source)
-
-    methods = rp.schema['methods']
+    methods = ruby_schema(source)['methods']
 
     assert len(methods) == 6
 
@@ -285,9 +276,7 @@ def test_single_module_with_class():
     This unit test tests parsing of single module
     '''
     source = DIR + "example7.rb"
-    rp = create_ruby_parser(source)
-
-    classes = rp.schema['classes']
+    classes = ruby_schema(source)['classes']
 
     assert len(classes) == 1
 
@@ -330,9 +319,7 @@ def test_class_in_condition_case():
     This unit test tests parsing of single module
     '''
     source = DIR + "example8.rb"
-    rp = create_ruby_parser(source)
-
-    classes = rp.schema['classes']
+    classes = ruby_schema(source)['classes']
 
     assert len(classes) == 1
 
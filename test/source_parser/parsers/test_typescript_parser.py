@@ -1,16 +1,93 @@
 # Copyright (c) Microsoft Corporation.
 # Licensed under the MIT License.
 
+from functools import lru_cache
+from pathlib import Path
 import pytest
 from source_parser.parsers import JavascriptParser
 
 DIR = "test/assets/typescript_examples/"
 
+SOURCES = {path.name: path.read_bytes() for path in Path(DIR).glob("*.ts")}
 
+
+@lru_cache(maxsize=None)
 def create_javascript_parser(source):
-    with open(source, 'r', encoding='utf-8') as file:
-        jp = JavascriptParser(file.read())
-    return jp
+    return JavascriptParser(SOURCES[Path(source).name])
+
+
+@lru_cache(maxsize=None)
+def javascript_schema(source):
+    return create_javascript_parser(source).schema
+
+
+@lru_cache(maxsize=None)
+def method_signatures(source):
+    return frozenset(method['signature'] for method in javascript_schema(source)['methods'])
+
+
+EXPORTED_CLASSES = [{'attributes': {'decorators': [],
+                                    'expression': ['name: string', 'year: number'],
+                                    'heritage': []},
+                     'definition': '       class Car',
+                     'byte_span': (149, 421),
+                     'class_docstring': '\nexported class\n',
+                     'end_point': (27, 1),
+                     'methods': [{'attributes': {},
+                                  'body': '{\n'
+                                  '      this.name = name;\n'
+                                  '      this.year = year;\n'
+                                  '    }',
+                                  'byte_span': (206, 285),
+                                  'default_arguments': {'name': '', 'year': ''},
+                                  'docstring': '',
+                                  'end_point': (18, 5),
+                                  'name': 'constructor',
+                                  'original_string': 'constructor(name, year) {\n'
+                                  '      this.name = name;\n'
+                                  '      this.year = year;\n'
+                                  '    }',
+                                  'signature': 'constructor(name, year)',
+                                  'start_point': (15, 4),
+                                  'syntax_pass': True},
+                                 {'attributes': {},
+                                  'body': '{\n'
+                                  '      let date = new Date();\n'
+                                  '      return date.getFullYear() - this.year;\n'
+                                  '    }',
+                                  'byte_span': (332, 419),
+                                  'default_arguments': {},
+                                  'docstring': '\nget the age of the car\n',
+                                  'end_point': (26, 5),
+                                  'name': 'age',
+                                  'original_string': 'age() {\n'
+                                  '      let date = new Date();\n'
+                                  '      return date.getFullYear() - '
+                                  'this.year;\n'
+                                  '    }',
+                                  'signature': 'age()',
+                                  'start_point': (23, 4),
+                                  'syntax_pass': True}],
+                     'name': 'Car',
+                     'original_string': 'export class Car {\n'
+                     '    name: string;\n'
+                     '    year: number;\n'
+                     '    \n'
+                     '    constructor(name, year) {\n'
+                     '      this.name = name;\n'
+                     '      this.year = year;\n'
+                     '    }\n'
+                     '\n'
+                     '    /*\n'
+                     '    get the age of the car\n'
+                     '    */\n'
+                     '    age() {\n'
+                     '      let date = new Date();\n'
+                     '      return date.getFullYear() - this.year;\n'
+                     '    }\n'
+                     '}',
+                     'start_point': (11, 7),
+                     'syntax_pass': True}]
 
 
 @pytest.mark.parametrize(
@@ -18,76 +95,12 @@ def create_javascript_parser(source):
     [
         (
             "test/assets/typescript_examples/exports.ts",
-            [{'attributes': {'decorators': [],
-                             'expression': ['name: string', 'year: number'],
-                             'heritage': []},
-              'definition': '       class Car',
-              'byte_span': (149, 421),
-              'class_docstring': '\nexported class\n',
-              'end_point': (27, 1),
-              'methods': [{'attributes': {},
-                           'body': '{\n'
-                           '      this.name = name;\n'
-                           '      this.year = year;\n'
-                           '    }',
-                           'byte_span': (206, 285),
-                           'default_arguments': {'name': '', 'year': ''},
-                           'docstring': '',
-                           'end_point': (18, 5),
-                           'name': 'constructor',
-                           'original_string': 'constructor(name, year) {\n'
-                           '      this.name = name;\n'
-                           '      this.year = year;\n'
-                           '    }',
-                           'signature': 'constructor(name, year)',
-                           'start_point': (15, 4),
-                           'syntax_pass': True},
-                          {'attributes': {},
-                           'body': '{\n'
-                           '      let date = new Date();\n'
-                           '      return date.getFullYear() - this.year;\n'
-                           '    }',
-                           'byte_span': (332, 419),
-                           'default_arguments': {},
-                           'docstring': '\nget the age of the car\n',
-                           'end_point': (26, 5),
-                           'name': 'age',
-                           'original_string': 'age() {\n'
-                           '      let date = new Date();\n'
-                           '      return date.getFullYear() - '
-                           'this.year;\n'
-                           '    }',
-                           'signature': 'age()',
-                           'start_point': (23, 4),
-                           'syntax_pass': True}],
-              'name': 'Car',
-              'original_string': 'export class Car {\n'
-              '    name: string;\n'
-              '    year: number;\n'
-              '    \n'
-              '    constructor(name, year) {\n'
-              '      this.name = name;\n'
-              '      this.year = year;\n'
-              '    }\n'
-              '\n'
-              '    /*\n'
-              '    get the age of the car\n'
-              '    */\n'
-              '    age() {\n'
-              '      let date = new Date();\n'
-              '      return date.getFullYear() - this.year;\n'
-              '    }\n'
-              '}',
-              'start_point': (11, 7),
-              'syntax_pass': True}]
+            EXPORTED_CLASSES
         )
     ],
 )
 def test_get_exported_class(source, target):
-    jp = create_javascript_parser(source)
-    print("target")
-    print(target)
-    assert jp.schema['classes'] == target
+    assert javascript_schema(source)['classes'] == target
 
 
 @pytest.mark.parametrize(
@@ -118,10 +131,4 @@ def test_get_exported_class(source, target):
     ],
 )
 def test_get_signatures(source, target):
-    jp = create_javascript_parser(source)
-    signatures = []
-    for method in jp.schema['methods']:
-        signatures.append(method['signature'])
-    print("target")
-    print(target)
-    assert set(signatures) == target
+    assert method_signatures(source) == target